@@ -1,17 +1,47 @@
 """Configuration management for the agent."""
 
-from src.config.settings import Settings, get_settings
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from src.config.constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_MAX_TOKENS,
     DEFAULT_EVALUATION_THRESHOLD,
 )
-from src.config.tables import (
-    DataLayer,
-    TableName,
-    TableNameManager,
-    get_table_manager,
-)
+
+if TYPE_CHECKING:
+    from src.config.settings import Settings, get_settings
+    from src.config.tables import (
+        DataLayer,
+        TableName,
+        TableNameManager,
+        get_table_manager,
+    )
+
+# Settings and table helpers pull in pydantic-settings; resolve them on first
+# attribute access (PEP 562) so importing constants stays lightweight.
+_LAZY_EXPORTS = {
+    "Settings": "src.config.settings",
+    "get_settings": "src.config.settings",
+    "DataLayer": "src.config.tables",
+    "TableName": "src.config.tables",
+    "TableNameManager": "src.config.tables",
+    "get_table_manager": "src.config.tables",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Settings
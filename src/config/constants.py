@@ -28,4 +28,4 @@ EVALUATION_METRICS = [
 ]
 
 # Database
-SUPPORTED_DB_DRIVERS = ["postgresql", "postgresql+asyncpg"]
+SUPPORTED_DB_DRIVERS = frozenset({"postgresql", "postgresql+asyncpg"})  # O(1) membership checks
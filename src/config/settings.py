@@ -20,6 +20,20 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=8)
+def _to_sync_url(url: str) -> str:
+    """Convert a database URL to its synchronous (psycopg2) form."""
+    return url.replace("postgresql+asyncpg://", "postgresql://")
+
+
+@lru_cache(maxsize=8)
+def _to_async_url(url: str) -> str:
+    """Convert a database URL to its asyncpg form."""
+    if "asyncpg" not in url:
+        return url.replace("postgresql://", "postgresql+asyncpg://")
+    return url
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -134,14 +148,12 @@ class Settings(BaseSettings):
     @property
     def database_url_sync(self) -> str:
         """Get synchronous database URL (converts async URL if needed)."""
-        return self.database_url.replace("postgresql+asyncpg://", "postgresql://")
+        return _to_sync_url(self.database_url)
 
     @property
     def database_url_async(self) -> str:
         """Get async database URL."""
-        if "asyncpg" not in self.database_url:
-            return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
-        return self.database_url
+        return _to_async_url(self.database_url)
 
 
 @lru_cache
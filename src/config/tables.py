@@ -14,7 +14,9 @@ Usage:
     table = manager.get(TableName.AGENT_RUNS)  # "dev_silver_agent_runs"
 """
 
+import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Literal
 
 from src.config.settings import get_settings
@@ -59,6 +61,9 @@ class TableName(str, Enum):
 
 EnvironmentType = Literal["local", "dev", "stg", "prod"]
 
+# Enum members resolved once; iterating the Enum class itself is slower
+_ALL_TABLES: tuple[TableName, ...] = tuple(TableName)
+
 
 class TableNameManager:
     """
@@ -77,6 +82,8 @@ class TableNameManager:
         - Easy identification of table purpose
     """
 
+    __slots__ = ("_env", "_layer", "_cache")
+
     def __init__(
         self,
         env: EnvironmentType | None = None,
@@ -93,8 +100,24 @@ class TableNameManager:
             settings = get_settings()
             env = settings.app_environment
         
-        self.env = env
-        self.layer = layer
+        self._env = env
+        self._layer = layer
+        # env and layer are fixed, so every name can be built once up front.
+        # Interned so every manager shares one string per qualified name.
+        self._cache: dict[TableName, str] = {
+            table: sys.intern(f"{env}_{layer.value}_{table.value}")
+            for table in _ALL_TABLES
+        }
+
+    @property
+    def env(self) -> EnvironmentType:
+        """Environment prefix (read-only; managers are shared and cached)."""
+        return self._env
+
+    @property
+    def layer(self) -> DataLayer:
+        """Data layer prefix (read-only; the name cache is built from it)."""
+        return self._layer
 
     def get(self, table: TableName) -> str:
         """
@@ -109,7 +132,7 @@ class TableNameManager:
         Example:
             manager.get(TableName.AGENT_RUNS)  # "dev_silver_agent_runs"
         """
-        return f"{self.env}_{self.layer.value}_{table.value}"
+        return self._cache[table]
 
     def get_all(self) -> dict[TableName, str]:
         """
@@ -118,17 +141,31 @@ class TableNameManager:
         Returns:
             Dict mapping TableName enum to fully-qualified name
         """
-        return {table: self.get(table) for table in TableName}
+        return dict(self._cache)
 
     def __repr__(self) -> str:
         return f"TableNameManager(env='{self.env}', layer='{self.layer.value}')"
 
 
+@lru_cache(maxsize=16)
+def _cached_table_manager(
+    env: EnvironmentType,
+    layer: DataLayer,
+) -> TableNameManager:
+    """Build (once) the manager for an explicit environment and layer."""
+    return TableNameManager(env=env, layer=layer)
+
+
 def get_table_manager(
     layer: DataLayer = DataLayer.SILVER,
 ) -> TableNameManager:
     """
-    Factory function to create a TableNameManager with current environment.
+    Factory function to get a TableNameManager for the current environment.
+    
+    Managers are cached per (environment, layer), so repeated calls return
+    the same instance. The environment is read from the cached settings,
+    so reloading settings (get_settings.cache_clear()) picks up a new
+    environment without clearing this cache.
     
     Args:
         layer: Data layer to use (defaults to SILVER)
@@ -136,4 +173,8 @@ def get_table_manager(
     Returns:
         TableNameManager configured for current environment
     """
-    return TableNameManager(env=None, layer=layer)
+    return _cached_table_manager(get_settings().app_environment, layer)
+
+
+# Expose the underlying cache control, mirroring get_settings.cache_clear()
+get_table_manager.cache_clear = _cached_table_manager.cache_clear  # type: ignore[attr-defined]
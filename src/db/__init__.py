@@ -1,14 +1,48 @@
 """Database models and connection management."""
 
-from src.db.models import Base, AgentRun
-from src.db.schemas import AgentRunCreate, AgentRunRecord
-from src.db.connection import get_session, init_db
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.db.models import Base, AgentRun
+    from src.db.schemas import TABLE_SCHEMA_REGISTRY, AgentRunCreate, AgentRunRecord
+    from src.db.connection import get_session, init_db
+    from src.db.writes import bulk_insert_runs
+
+# Models pull in SQLAlchemy; resolve exports on first attribute access
+# (PEP 562) so importing one submodule does not load the others.
+_LAZY_EXPORTS = {
+    "Base": "src.db.models",
+    "AgentRun": "src.db.models",
+    "AgentRunCreate": "src.db.schemas",
+    "AgentRunRecord": "src.db.schemas",
+    "TABLE_SCHEMA_REGISTRY": "src.db.schemas",
+    "get_session": "src.db.connection",
+    "init_db": "src.db.connection",
+    "bulk_insert_runs": "src.db.writes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Base",
     "AgentRun",
     "AgentRunCreate",
     "AgentRunRecord",
+    "TABLE_SCHEMA_REGISTRY",
     "get_session",
     "init_db",
+    "bulk_insert_runs",
 ]
@@ -3,19 +3,31 @@ Database connection management.
 
 Provides utilities for creating database connections, sessions,
 and managing the connection lifecycle.
+
+SQLAlchemy (and the ORM models) are imported inside the functions that
+need them, so importing this module does not pay SQLAlchemy's import cost.
 """
 
 from contextlib import contextmanager
-from typing import Generator
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from functools import lru_cache
+from typing import TYPE_CHECKING, Generator
 
 from src.config.settings import get_settings
-from src.db.models import Base
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.orm import Session, sessionmaker
+
+# Pool behaviour shared by sync and async engines. Connections are recycled
+# hourly instead of being pinged on every checkout.
+_POOL_RECYCLE_SECONDS = 3600
+
+# Fixed per-connection session options, applied once at connect time
+_CONNECT_ARGS = {"options": "-c timezone=utc"}
 
-def get_engine(echo: bool = False):
+
+def get_engine(echo: bool = False) -> "Engine":
     """
     Create a SQLAlchemy engine.
     
@@ -25,16 +37,50 @@ def get_engine(echo: bool = False):
     Returns:
         SQLAlchemy Engine instance
     """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import QueuePool
+
     settings = get_settings()
     return create_engine(
         settings.database_url_sync,
+        poolclass=QueuePool,
         pool_size=settings.database_pool_size,
         max_overflow=settings.database_max_overflow,
+        pool_pre_ping=False,
+        pool_recycle=_POOL_RECYCLE_SECONDS,
+        connect_args=_CONNECT_ARGS,
         echo=echo,
     )
 
 
-def get_session_factory(engine=None) -> sessionmaker:
+def get_async_engine(echo: bool = False) -> "AsyncEngine":
+    """
+    Create an async SQLAlchemy engine (requires the asyncpg driver).
+    
+    Args:
+        echo: If True, log all SQL statements (useful for debugging)
+    
+    Returns:
+        SQLAlchemy AsyncEngine instance
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    settings = get_settings()
+    return create_async_engine(
+        settings.database_url_async,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=False,
+        pool_recycle=_POOL_RECYCLE_SECONDS,
+        # asyncpg takes session settings directly rather than libpq options
+        connect_args={"server_settings": {"timezone": "utc"}},
+        echo=echo,
+    )
+
+
+def get_session_factory(engine=None) -> "sessionmaker":
     """
     Create a session factory.
     
@@ -44,27 +90,45 @@ def get_session_factory(engine=None) -> sessionmaker:
     Returns:
         SQLAlchemy sessionmaker instance
     """
+    from sqlalchemy.orm import sessionmaker
+
     if engine is None:
         engine = get_engine()
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@lru_cache(maxsize=1)
+def _get_cached_engine() -> "Engine":
+    """Get the process-wide engine, created on first use."""
+    return get_engine()
+
+
+@lru_cache(maxsize=1)
+def _get_cached_session_factory() -> "sessionmaker[Session]":
+    """Get the process-wide session factory bound to the cached engine."""
+    return get_session_factory(engine=_get_cached_engine())
+
+
 @contextmanager
-def get_session() -> Generator[Session, None, None]:
+def get_session() -> Generator["Session", None, None]:
     """
     Context manager for database sessions.
     
     Provides a transactional scope around a series of operations.
     Automatically commits on success and rolls back on error.
     
+    Sessions share one engine (and connection pool) per process. Call
+    _get_cached_engine.cache_clear() and
+    _get_cached_session_factory.cache_clear() to rebuild them (useful for
+    testing).
+    
     Usage:
         with get_session() as session:
             entity = Entity(name="test", ...)
             session.add(entity)
             # Commits automatically when exiting the context
     """
-    SessionLocal = get_session_factory()
-    session = SessionLocal()
+    session = _get_cached_session_factory()()
     try:
         yield session
         session.commit()
@@ -85,6 +149,8 @@ def init_db(engine=None) -> None:
     Args:
         engine: Optional engine instance. If not provided, creates one.
     """
+    from src.db.models import Base
+
     if engine is None:
         engine = get_engine()
     Base.metadata.create_all(bind=engine)
@@ -100,6 +166,8 @@ def drop_db(engine=None) -> None:
     Args:
         engine: Optional engine instance. If not provided, creates one.
     """
+    from src.db.models import Base
+
     if engine is None:
         engine = get_engine()
     Base.metadata.drop_all(bind=engine)
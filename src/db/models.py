@@ -11,10 +11,13 @@ Current models (ReAct agent):
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Native Postgres ENUM: stored as a 4-byte tag instead of a varchar
+AgentRunStatus = Enum("running", "success", "error", name="agent_run_status")
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -47,24 +50,29 @@ class AgentRun(Base, TimestampMixin):
     """
 
     __tablename__ = "agent_runs"
+    __table_args__ = (
+        # Serves dashboard filters on type + status ordered by recency
+        Index("ix_agent_runs_type_status_created", "agent_type", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     run_id: Mapped[str] = mapped_column(
         String(36), nullable=False, unique=True, index=True
     )
     agent_type: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        String(50), nullable=False
     )  # "react" for now, later "rag", "chatbot", etc.
     input_text: Mapped[str] = mapped_column(Text, nullable=False)
     output_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="running"
-    )  # "running", "success", "error"
+        AgentRunStatus, nullable=False, default="running"
+    )
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     latency_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     token_count_input: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     token_count_output: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    metadata_: Mapped[Optional[dict]] = mapped_column(
+    # "metadata" is reserved on declarative classes; the column keeps that name
+    meta: Mapped[Optional[dict]] = mapped_column(
         "metadata", JSONB, nullable=True, default=dict
     )
 
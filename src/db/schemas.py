@@ -28,9 +28,7 @@ class AgentRunBase(BaseModel):
     latency_ms: Optional[int] = Field(default=None, ge=0)
     token_count_input: Optional[int] = Field(default=None, ge=0)
     token_count_output: Optional[int] = Field(default=None, ge=0)
-    metadata_: Optional[dict] = Field(default=None, alias="metadata")
-
-    model_config = ConfigDict(populate_by_name=True)
+    meta: Optional[dict] = Field(default=None)  # stored in the "metadata" column
 
 
 class AgentRunCreate(AgentRunBase):
@@ -46,4 +44,13 @@ class AgentRunRecord(AgentRunBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Schema for each table, checked by validate_table_has_schema().
+# Add an entry here whenever a table is added to TableName. Keys are the
+# plain TableName values (a str Enum, so members look up the same entry);
+# importing TableName here would load settings along with the schemas.
+TABLE_SCHEMA_REGISTRY: dict[str, type[BaseModel]] = {
+    "agent_runs": AgentRunRecord,
+}
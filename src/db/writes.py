@@ -0,0 +1,46 @@
+"""
+Write helpers for high-volume tables.
+
+The ORM path (session.add(AgentRun(...))) runs unit-of-work bookkeeping
+and emits one INSERT per object. For observability writes we bypass that
+and execute a prebuilt Core-style INSERT with a list of parameter dicts,
+which SQLAlchemy batches into multi-row INSERT statements.
+
+Usage:
+    from src.db.connection import get_session
+    from src.db.writes import bulk_insert_runs
+    
+    with get_session() as session:
+        bulk_insert_runs(session, [run.model_dump() for run in runs])
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.db.models import AgentRun
+
+# Built once; reused for every batch
+_INSERT_AGENT_RUN = insert(AgentRun)
+
+
+def bulk_insert_runs(
+    session: Session,
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """
+    Insert agent runs in a single batched statement.
+    
+    Also the preferred path for a single row (pass a one-element list),
+    since it skips the ORM identity map.
+    
+    Args:
+        session: Active SQLAlchemy session (committed by the caller)
+        rows: Row dicts keyed by AgentRun attribute names, e.g. from
+              AgentRunCreate.model_dump()
+    """
+    if not rows:
+        return
+    session.execute(_INSERT_AGENT_RUN, list(rows))
@@ -15,11 +15,29 @@ Usage:
     formatted = prompt.format(tools="calculator", question="What is 2+2?")
 """
 
+import os
+import string
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any, Self
 
-import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+_FORMATTER = string.Formatter()
+
+# (literal_text, field_name, format_spec, conversion) as yielded by Formatter.parse
+_Segment = tuple[str, str | None, str | None, str | None]
+
+
+def _placeholder_names(segments: Iterable[_Segment]) -> Iterator[str]:
+    """Yield the variable names a parsed template reads, including nested specs."""
+    for _, field_name, format_spec, _ in segments:
+        if field_name:
+            # "user.name" and "items[0]" both read the variable before the lookup
+            yield field_name.partition(".")[0].partition("[")[0]
+        if format_spec and "{" in format_spec:
+            yield from _placeholder_names(_FORMATTER.parse(format_spec))
 
 
 class PromptTemplate(BaseModel):
@@ -32,14 +50,24 @@ class PromptTemplate(BaseModel):
         description: Human-readable description
         template: The prompt text with {variable} placeholders
         variables: List of required variable names
+    
+    Templates are immutable, and model_copy() re-derives the placeholder
+    sets computed at construction, so they cannot go stale.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=1)
     version: str = Field(default="1.0.0")
     description: str = Field(default="")
     template: str = Field(..., min_length=1)
     variables: list[str] = Field(default_factory=list)
 
+    if TYPE_CHECKING:
+        # Derived once at construction, reused by format() and validate_variables()
+        _declared: frozenset[str]
+        _placeholders: frozenset[str]
+
     @field_validator("variables", mode="before")
     @classmethod
     def ensure_list(cls, v: Any) -> list[str]:
@@ -50,6 +78,28 @@ class PromptTemplate(BaseModel):
             return [v]
         return list(v)
 
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the declared variables and the template's placeholders."""
+        # Stored as plain instance attributes: they read much faster than
+        # PrivateAttr and, not being fields, stay out of model_dump()
+        self.__dict__["_declared"] = frozenset(self.variables)
+        # Same parser str.format uses, so {{escapes}}, !conversions and :specs
+        # are treated exactly as they are at render time
+        self.__dict__["_placeholders"] = frozenset(
+            _placeholder_names(_FORMATTER.parse(self.template))
+        )
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the template, re-deriving cached state if fields changed."""
+        copy = super().model_copy(update=update, deep=deep)
+        # model_copy copies the derived attributes without re-running
+        # model_post_init, so an update would leave them describing self
+        if update:
+            copy.model_post_init(None)
+        return copy
+
     def format(self, **kwargs: Any) -> str:
         """
         Format the template with provided variables.
@@ -63,11 +113,14 @@ class PromptTemplate(BaseModel):
         Raises:
             KeyError: If a required variable is missing
         """
-        missing = set(self.variables) - set(kwargs.keys())
+        missing = self._declared - kwargs.keys()
         if missing:
-            raise KeyError(f"Missing required variables: {missing}")
+            raise KeyError(f"Missing required variables: {set(missing)}")
         
-        return self.template.format(**kwargs)
+        try:
+            return self.template.format_map(kwargs)
+        except KeyError as e:
+            raise KeyError(f"Missing required variable: {e.args[0]}") from None
 
     def validate_variables(self) -> list[str]:
         """
@@ -77,25 +130,34 @@ class PromptTemplate(BaseModel):
             List of error messages (empty if valid)
         """
         errors = []
-        
-        # Find all {variable} placeholders in template
-        import re
-        placeholders = set(re.findall(r"\{(\w+)\}", self.template))
-        declared = set(self.variables)
+        placeholders = self._placeholders
+        declared = self._declared
         
         # Check for undeclared placeholders
         undeclared = placeholders - declared
         if undeclared:
-            errors.append(f"Undeclared variables in template: {undeclared}")
+            errors.append(f"Undeclared variables in template: {set(undeclared)}")
         
         # Check for unused declared variables
         unused = declared - placeholders
         if unused:
-            errors.append(f"Declared but unused variables: {unused}")
+            errors.append(f"Declared but unused variables: {set(unused)}")
         
         return errors
 
 
+@lru_cache(maxsize=1)
+def _yaml_load() -> Callable[[IO[bytes]], Any]:
+    """
+    Get a safe YAML load function, importing PyYAML on first use.
+    
+    Prefers the libyaml C loader when PyYAML was built with it.
+    """
+    import yaml
+
+    return partial(yaml.load, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
 class PromptRegistry:
     """
     Registry for loading and managing prompt templates.
@@ -110,6 +172,8 @@ class PromptRegistry:
         prompt = registry.get("react_reasoning")
     """
 
+    __slots__ = ("_prompts",)
+
     def __init__(self):
         self._prompts: dict[str, PromptTemplate] = {}
 
@@ -153,9 +217,8 @@ class PromptRegistry:
         Returns:
             Loaded PromptTemplate
         """
-        path = Path(path)
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
+        with open(path, "rb") as f:
+            data = _yaml_load()(f)
         
         prompt = PromptTemplate(**data)
         self.register(prompt)
@@ -171,12 +234,12 @@ class PromptRegistry:
         Returns:
             List of loaded PromptTemplates
         """
-        directory = Path(directory)
         prompts = []
         
-        for yaml_file in directory.glob("*.yaml"):
-            prompt = self.load_from_yaml(yaml_file)
-            prompts.append(prompt)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".yaml") and entry.is_file():
+                    prompts.append(self.load_from_yaml(entry.path))
         
         return prompts
 
@@ -196,21 +259,20 @@ class PromptRegistry:
         return errors
 
 
-# Global registry instance (can be imported directly)
-_global_registry: PromptRegistry | None = None
+# Default prompts shipped with the project
+_DEFAULT_PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
 
 
+@lru_cache
 def get_prompt_registry() -> PromptRegistry:
     """
     Get the global prompt registry.
     
     Creates the registry and loads default prompts on first call.
+    Uses lru_cache (like get_settings) so later calls skip the lookup
+    entirely. Call get_prompt_registry.cache_clear() to reload prompts.
     """
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = PromptRegistry()
-        # Load default prompts if directory exists
-        prompts_dir = Path(__file__).parent.parent.parent / "prompts"
-        if prompts_dir.exists():
-            _global_registry.load_from_directory(prompts_dir)
-    return _global_registry
+    registry = PromptRegistry()
+    if _DEFAULT_PROMPTS_DIR.exists():
+        registry.load_from_directory(_DEFAULT_PROMPTS_DIR)
+    return registry
@@ -16,16 +16,21 @@ Usage:
     assert len(errors) == 0, f"Schema drift detected: {errors}"
 """
 
+from functools import lru_cache
 from typing import Any, Type, get_args, get_origin
 
 from pydantic import BaseModel
 
+# Numeric types that may be stored interchangeably
+_NUMERIC_TYPES = frozenset({int, float})
 
+
+@lru_cache(maxsize=128)
 def validate_schema_alignment(
     llm_schema: Type[BaseModel],
     db_schema: Type[BaseModel],
     strict: bool = False,
-) -> list[str]:
+) -> tuple[str, ...]:
     """
     Validate that LLM response schema fields can be stored in DB schema.
     
@@ -39,7 +44,11 @@ def validate_schema_alignment(
                 only require LLM fields to be a subset of DB fields.
     
     Returns:
-        List of error messages. Empty list means schemas are aligned.
+        Tuple of error messages. Empty tuple means schemas are aligned.
+    
+    Results are cached per (llm_schema, db_schema, strict) since schema
+    classes do not change at runtime. Call
+    validate_schema_alignment.cache_clear() after rebuilding a model.
     
     Example:
         errors = validate_schema_alignment(
@@ -74,6 +83,10 @@ def validate_schema_alignment(
         llm_field = llm_schema.model_fields[field_name]
         db_field = db_schema.model_fields[field_name]
         
+        # Fast path: identical annotations need no normalization
+        if llm_field.annotation == db_field.annotation:
+            continue
+        
         llm_type = _normalize_type(llm_field.annotation)
         db_type = _normalize_type(db_field.annotation)
         
@@ -84,7 +97,7 @@ def validate_schema_alignment(
                 f"{db_schema.__name__}.{field_name} is {db_field.annotation}"
             )
     
-    return errors
+    return tuple(errors)
 
 
 def _normalize_type(type_hint: Any) -> Any:
@@ -126,8 +139,7 @@ def _types_compatible(type1: Any, type2: Any) -> bool:
         return True
     
     # Numeric compatibility
-    numeric_types = {int, float}
-    if type1_inner in numeric_types and type2_inner in numeric_types:
+    if type1_inner in _NUMERIC_TYPES and type2_inner in _NUMERIC_TYPES:
         return True
     
     return False
@@ -145,8 +157,8 @@ def _unwrap_optional(type_hint: Any) -> Any:
 
 
 def validate_table_has_schema(
-    table_names: list[str],
-    schema_registry: dict[str, Type[BaseModel]],
+    table_names: list[str] | None = None,
+    schema_registry: dict[str, Type[BaseModel]] | None = None,
 ) -> list[str]:
     """
     Validate that every table name has a corresponding schema.
@@ -155,16 +167,28 @@ def validate_table_has_schema(
     but forgetting to create its Pydantic schema.
     
     Args:
-        table_names: List of table name strings
-        schema_registry: Dict mapping table names to Pydantic schemas
+        table_names: List of table name strings. Defaults to every
+                     TableName member.
+        schema_registry: Dict mapping table names to Pydantic schemas.
+                         Defaults to src.db.schemas.TABLE_SCHEMA_REGISTRY.
     
     Returns:
         List of error messages for tables without schemas
     """
-    errors = []
-    
-    for table_name in table_names:
-        if table_name not in schema_registry:
-            errors.append(f"Table '{table_name}' has no registered schema")
-    
-    return errors
+    if table_names is None:
+        from src.config.tables import TableName
+        table_names = [table.value for table in TableName]
+    if schema_registry is None:
+        from src.db.schemas import TABLE_SCHEMA_REGISTRY
+        schema_registry = TABLE_SCHEMA_REGISTRY
+    
+    missing = set(table_names) - schema_registry.keys()
+    if not missing:
+        return []
+    
+    # Report in the caller's order rather than set order
+    return [
+        f"Table '{getattr(table_name, 'value', table_name)}' has no registered schema"
+        for table_name in table_names
+        if table_name in missing
+    ]
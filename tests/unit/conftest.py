@@ -0,0 +1,13 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _default_api_key(monkeypatch) -> None:
+    """
+    Provide a valid OpenAI API key for every unit test.
+    
+    Tests that need a different key override it with monkeypatch.setenv.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
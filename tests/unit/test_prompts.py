@@ -2,8 +2,42 @@
 
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+from pydantic import ValidationError
 
-from src.prompts.registry import PromptTemplate, PromptRegistry
+from src.prompts import registry as registry_module
+from src.prompts.registry import PromptTemplate, PromptRegistry, get_prompt_registry
+
+
+# Project prompt directory, resolved once for the module
+_PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
+
+
+@pytest.fixture(scope="module")
+def _loaded_real_registry() -> PromptRegistry:
+    """Parse the project's prompt directory once for the whole module."""
+    if not _PROMPTS_DIR.exists():
+        pytest.skip("Prompts directory not found")
+    
+    registry = PromptRegistry()
+    registry.load_from_directory(_PROMPTS_DIR)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def _two_prompt_dir(tmp_path_factory) -> Path:
+    """Directory holding two minimal prompt files, written once per module."""
+    directory = tmp_path_factory.mktemp("prompts")
+    (directory / "prompt1.yaml").write_text("""
+name: prompt1
+template: "Test 1"
+""")
+    (directory / "prompt2.yaml").write_text("""
+name: prompt2
+template: "Test 2"
+""")
+    return directory
 
 
 class TestPromptTemplate:
@@ -58,6 +92,66 @@ class TestPromptTemplate:
         
         assert result == "Hello Bob!"
 
+    @pytest.mark.parametrize("template,variables,values", [
+        ("{{literal}} {name!r} scored {score:.1f}", ["name", "score"],
+         {"name": "Ann", "score": 9.25}),
+        ("Hello {user.real}!", ["user"], {"user": 2 + 3j}),
+        ("Value: {data[k]}", ["data"], {"data": {"k": "v"}}),
+        ("{x:{w}}", ["x", "w"], {"x": 1, "w": 5}),
+    ])
+    def test_format_matches_str_format(self, template, variables, values):
+        """Formatting should match str.format for the full field syntax."""
+        prompt = PromptTemplate(name="test", template=template, variables=variables)
+
+        assert prompt.format(**values) == template.format(**values)
+
+    def test_lookup_placeholders_validate_by_root_name(self):
+        """Attribute/index lookups and nested specs should count their root variable."""
+        prompt = PromptTemplate(
+            name="test",
+            template="{user.name} owes {amounts[0]:{width}}",
+            variables=["user", "amounts", "width"]
+        )
+
+        assert prompt.validate_variables() == []
+
+    def test_lookup_placeholder_missing_variable_raises_error(self):
+        """Missing variables should raise the same KeyError for fallback templates."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {user.name} from {place}!",
+            variables=["user"]
+        )
+
+        with pytest.raises(KeyError) as exc_info:
+            prompt.format(user=SimpleNamespace(name="Ann"))
+
+        assert "place" in str(exc_info.value)
+
+    def test_prompt_is_immutable(self):
+        """Templates should be frozen so cached derived state stays valid."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {name}!",
+            variables=["name"]
+        )
+
+        with pytest.raises(ValidationError):
+            prompt.template = "Bye {name}!"
+
+    def test_model_copy_rederives_parsed_template(self):
+        """A copy with an updated template should render the new template."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {a}!",
+            variables=["a"]
+        )
+
+        copy = prompt.model_copy(update={"template": "Bye {b}", "variables": ["b"]})
+
+        assert copy.format(b=1) == "Bye 1"
+        assert prompt.format(a=1) == "Hello 1!"
+
     def test_validate_variables_success(self):
         """Should return empty list when variables match placeholders."""
         prompt = PromptTemplate(
@@ -96,6 +190,70 @@ class TestPromptTemplate:
         assert len(errors) == 1
         assert "unused_var" in errors[0]
 
+    def test_placeholders_cached_at_construction(self):
+        """Placeholders should be parsed once and reused by validation."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {name} from {place}!",
+            variables=["name", "place"]
+        )
+        placeholders = prompt._placeholders
+
+        assert placeholders == frozenset({"name", "place"})
+        assert prompt.validate_variables() == []
+        assert prompt._placeholders is placeholders
+
+    def test_derived_sets_are_not_fields(self):
+        """Cached sets should stay out of model_dump() and equality."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {name}!",
+            variables=["name"]
+        )
+
+        assert prompt.model_dump().keys() == PromptTemplate.model_fields.keys()
+        assert prompt == PromptTemplate(**prompt.model_dump())
+
+    def test_placeholders_follow_model_copy(self):
+        """Cached placeholder/declared sets should describe an updated copy."""
+        prompt = PromptTemplate(
+            name="test",
+            template="Hello {a}!",
+            variables=["a"]
+        )
+
+        copy = prompt.model_copy(update={"template": "Bye {b}", "variables": ["a"]})
+
+        assert copy._placeholders == frozenset({"b"})
+        assert len(copy.validate_variables()) == 2
+        assert prompt.validate_variables() == []
+
+    def test_placeholder_cache_hit(self):
+        """The template should be parsed once, however often it is validated."""
+        with patch.object(
+            registry_module._FORMATTER, "parse", wraps=registry_module._FORMATTER.parse
+        ) as parse:
+            prompt = PromptTemplate(
+                name="test",
+                template="Hello {name} from {place}!",
+                variables=["name", "place"]
+            )
+            for _ in range(3):
+                assert prompt.validate_variables() == []
+
+        parse.assert_called_once_with("Hello {name} from {place}!")
+
+    def test_placeholders_follow_format_syntax(self):
+        """Escaped braces are literal; specs and conversions are placeholders."""
+        prompt = PromptTemplate(
+            name="test",
+            template="{{literal}} {name!r} scored {score:.1f}",
+            variables=["name", "score"]
+        )
+
+        assert prompt._placeholders == frozenset({"name", "score"})
+        assert prompt.validate_variables() == []
+
     def test_variables_coerced_to_list(self):
         """Single string variable should be converted to list."""
         prompt = PromptTemplate(
@@ -174,20 +332,10 @@ variables:
         assert prompt.version == "2.0.0"
         assert registry.get("yaml_prompt") == prompt
 
-    def test_load_from_directory(self, tmp_path):
+    def test_load_from_directory(self, _two_prompt_dir):
         """Should load all YAML prompts from directory."""
-        # Create test YAML files
-        (tmp_path / "prompt1.yaml").write_text("""
-name: prompt1
-template: "Test 1"
-""")
-        (tmp_path / "prompt2.yaml").write_text("""
-name: prompt2
-template: "Test 2"
-""")
-        
         registry = PromptRegistry()
-        prompts = registry.load_from_directory(tmp_path)
+        prompts = registry.load_from_directory(_two_prompt_dir)
         
         assert len(prompts) == 2
         assert "prompt1" in registry.list_prompts()
@@ -217,48 +365,45 @@ template: "Test 2"
         assert "invalid" in errors
         assert "missing" in errors["invalid"][0]
 
+    @pytest.mark.filesystem
+    def test_global_registry_is_cached(self):
+        """get_prompt_registry should return the same loaded registry."""
+        registry = get_prompt_registry()
+
+        assert registry is get_prompt_registry()
+        assert "react_reasoning" in registry.list_prompts()
+
 
+@pytest.mark.filesystem
 class TestActualPromptFiles:
     """Tests for the actual prompt YAML files in the project."""
 
-    def test_react_reasoning_prompt_exists(self):
+    def test_react_reasoning_prompt_exists(self, _loaded_real_registry):
         """react_reasoning.yaml should exist and be valid."""
-        prompts_dir = Path(__file__).parent.parent.parent / "prompts"
-        prompt_file = prompts_dir / "react_reasoning.yaml"
+        prompt_file = _PROMPTS_DIR / "react_reasoning.yaml"
         
         assert prompt_file.exists(), f"Missing {prompt_file}"
         
-        registry = PromptRegistry()
-        prompt = registry.load_from_yaml(prompt_file)
+        prompt = _loaded_real_registry.get("react_reasoning")
         
         assert prompt.name == "react_reasoning"
         assert "tools" in prompt.variables
         assert "question" in prompt.variables
 
-    def test_react_tool_response_prompt_exists(self):
+    def test_react_tool_response_prompt_exists(self, _loaded_real_registry):
         """react_tool_response.yaml should exist and be valid."""
-        prompts_dir = Path(__file__).parent.parent.parent / "prompts"
-        prompt_file = prompts_dir / "react_tool_response.yaml"
+        prompt_file = _PROMPTS_DIR / "react_tool_response.yaml"
         
         assert prompt_file.exists(), f"Missing {prompt_file}"
         
-        registry = PromptRegistry()
-        prompt = registry.load_from_yaml(prompt_file)
+        prompt = _loaded_real_registry.get("react_tool_response")
         
         assert prompt.name == "react_tool_response"
         assert "tool_name" in prompt.variables
         assert "tool_result" in prompt.variables
 
-    def test_all_prompts_are_valid(self):
+    def test_all_prompts_are_valid(self, _loaded_real_registry):
         """All prompt YAML files should pass validation."""
-        prompts_dir = Path(__file__).parent.parent.parent / "prompts"
-        
-        if not prompts_dir.exists():
-            pytest.skip("Prompts directory not found")
-        
-        registry = PromptRegistry()
-        registry.load_from_directory(prompts_dir)
-        
-        errors = registry.validate_all()
+        errors = _loaded_real_registry.validate_all()
         
         assert errors == {}, f"Prompt validation errors: {errors}"
@@ -1,10 +1,69 @@
 """Unit tests for database schemas and alignment validation."""
 
+import subprocess
+import sys
+
 import pytest
 from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import get_args
+
+from pydantic import BaseModel
 
+from src.config.tables import TableName
 from src.db.schemas import AgentRunBase, AgentRunCreate, AgentRunRecord
-from src.schemas.validators import validate_schema_alignment
+from src.schemas.validators import validate_schema_alignment, validate_table_has_schema
+
+
+# Alignment fixtures, defined once so pydantic builds each schema once
+class _ExtraFieldOutput(BaseModel):
+    name: str
+    extra_field: str  # Not in DB
+
+
+class _NamedRecord(BaseModel):
+    name: str
+    id: int
+
+
+class _StrCountOutput(BaseModel):
+    count: str  # String in LLM
+
+
+class _IntCountRecord(BaseModel):
+    count: int  # Int in DB
+
+
+class _IntScoreOutput(BaseModel):
+    score: int
+
+
+class _FloatScoreRecord(BaseModel):
+    score: float
+
+
+_FIXED_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def _orm_like_obj() -> SimpleNamespace:
+    """Attribute-only stand-in for an AgentRun ORM row."""
+    return SimpleNamespace(
+        id=1,
+        run_id="test-123",
+        agent_type="react",
+        input_text="test input",
+        output_text="test output",
+        status="success",
+        error_message=None,
+        latency_ms=100,
+        token_count_input=10,
+        token_count_output=5,
+        meta={"key": "value"},
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
 
 
 class TestAgentRunSchemas:
@@ -32,11 +91,11 @@ class TestAgentRunSchemas:
             latency_ms=150,
             token_count_input=10,
             token_count_output=5,
-            metadata={"tool_calls": 1}
+            meta={"tool_calls": 1}
         )
         assert run.output_text == "The answer is 50"
         assert run.latency_ms == 150
-        assert run.metadata_ == {"tool_calls": 1}
+        assert run.meta == {"tool_calls": 1}
 
     def test_agent_run_status_validation(self):
         """Status must be one of the allowed values."""
@@ -57,6 +116,13 @@ class TestAgentRunSchemas:
                 status="invalid"
             )
 
+    def test_status_values_match_db_enum(self):
+        """Schema status literals should match the database ENUM labels."""
+        from src.db.models import AgentRunStatus
+
+        status_annotation = AgentRunBase.model_fields["status"].annotation
+        assert set(get_args(status_annotation)) == set(AgentRunStatus.enums)
+
     def test_agent_run_latency_must_be_positive(self):
         """Latency must be >= 0."""
         with pytest.raises(ValueError):
@@ -66,27 +132,12 @@ class TestAgentRunSchemas:
                 latency_ms=-1
             )
 
-    def test_agent_run_record_from_attributes(self):
+    def test_agent_run_record_from_attributes(self, _orm_like_obj):
         """AgentRunRecord should work with from_attributes for ORM."""
-        # Simulate an ORM object
-        class MockORM:
-            id = 1
-            run_id = "test-123"
-            agent_type = "react"
-            input_text = "test input"
-            output_text = "test output"
-            status = "success"
-            error_message = None
-            latency_ms = 100
-            token_count_input = 10
-            token_count_output = 5
-            metadata_ = {"key": "value"}
-            created_at = datetime.now()
-            updated_at = datetime.now()
-        
-        record = AgentRunRecord.model_validate(MockORM())
+        record = AgentRunRecord.model_validate(_orm_like_obj)
         assert record.id == 1
         assert record.run_id == "test-123"
+        assert record.meta == {"key": "value"}
 
 
 class TestSchemaAlignment:
@@ -101,45 +152,78 @@ class TestSchemaAlignment:
         )
         assert len(errors) == 0, f"Schema misalignment: {errors}"
 
+    def test_alignment_result_is_cached(self):
+        """Repeated calls with the same schemas should reuse the result."""
+        first = validate_schema_alignment(AgentRunCreate, AgentRunRecord, True)
+        second = validate_schema_alignment(AgentRunCreate, AgentRunRecord, True)
+
+        assert isinstance(first, tuple)
+        assert first is second
+
     def test_alignment_detects_missing_fields(self):
         """Validation should detect fields missing in DB schema."""
-        from pydantic import BaseModel
-        
-        class LLMOutput(BaseModel):
-            name: str
-            extra_field: str  # Not in DB
-        
-        class DBRecord(BaseModel):
-            name: str
-            id: int
-        
-        errors = validate_schema_alignment(LLMOutput, DBRecord)
+        errors = validate_schema_alignment(_ExtraFieldOutput, _NamedRecord)
         assert len(errors) == 1
         assert "extra_field" in errors[0]
 
     def test_alignment_detects_type_mismatch(self):
         """Validation should detect type mismatches."""
-        from pydantic import BaseModel
-        
-        class LLMOutput(BaseModel):
-            count: str  # String in LLM
-        
-        class DBRecord(BaseModel):
-            count: int  # Int in DB
-        
-        errors = validate_schema_alignment(LLMOutput, DBRecord)
+        errors = validate_schema_alignment(_StrCountOutput, _IntCountRecord)
         assert len(errors) == 1
         assert "Type mismatch" in errors[0]
 
     def test_alignment_allows_numeric_compatibility(self):
         """int and float should be considered compatible."""
-        from pydantic import BaseModel
-        
-        class LLMOutput(BaseModel):
-            score: int
-        
-        class DBRecord(BaseModel):
-            score: float
-        
-        errors = validate_schema_alignment(LLMOutput, DBRecord)
+        errors = validate_schema_alignment(_IntScoreOutput, _FloatScoreRecord)
         assert len(errors) == 0  # Should be compatible
+
+
+class TestTableHasSchema:
+    """Tests for table-to-schema registry validation."""
+
+    def test_all_tables_registered(self):
+        """No errors when every table has a schema."""
+        errors = validate_table_has_schema(
+            ["agent_runs"], {"agent_runs": AgentRunRecord}
+        )
+        assert errors == []
+
+    def test_missing_tables_reported_in_order(self):
+        """Missing tables should be reported in the order given."""
+        errors = validate_table_has_schema(
+            ["b_table", "agent_runs", "a_table"], {"agent_runs": AgentRunRecord}
+        )
+        assert errors == [
+            "Table 'b_table' has no registered schema",
+            "Table 'a_table' has no registered schema",
+        ]
+
+    def test_every_table_has_registered_schema(self):
+        """Every TableName member should have a schema in the default registry."""
+        assert validate_table_has_schema() == []
+
+    def test_registry_keys_are_plain_table_names(self):
+        """Registry keys should be exactly the TableName values, as plain strings."""
+        from src.db.schemas import TABLE_SCHEMA_REGISTRY
+
+        assert all(type(key) is str for key in TABLE_SCHEMA_REGISTRY)
+        assert set(TABLE_SCHEMA_REGISTRY) == {table.value for table in TableName}
+
+    def test_enum_table_names_reported_by_value(self):
+        """Errors for TableName members should show the plain table name."""
+        errors = validate_table_has_schema([TableName.AGENT_RUNS], {})
+        assert errors == ["Table 'agent_runs' has no registered schema"]
+
+
+class TestLazyImports:
+    """Importing schemas should not load the database stack."""
+
+    @pytest.mark.parametrize("module", ["sqlalchemy", "pydantic_settings"])
+    def test_importing_schemas_does_not_load_heavy_modules(self, module):
+        """src.db.schemas should be importable without SQLAlchemy or settings."""
+        code = f"import sys, src.db.schemas; sys.exit({module!r} in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+        )
+        assert result.returncode == 0
@@ -1,7 +1,10 @@
 """Unit tests for table name management."""
 
+from collections.abc import Generator
+
 import pytest
 
+from src.config.settings import get_settings
 from src.config.tables import (
     DataLayer,
     TableName,
@@ -10,31 +13,40 @@ from src.config.tables import (
 )
 
 
+@pytest.fixture(scope="class")
+def _dev_env() -> Generator:
+    """Point settings at the dev environment for a whole test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("APP_ENVIRONMENT", "dev")
+        yield
+
+
 class TestDataLayer:
     """Tests for DataLayer enum."""
 
-    def test_data_layer_values(self):
-        """DataLayer enum should have correct values."""
-        assert DataLayer.BRONZE.value == "bronze"
-        assert DataLayer.SILVER.value == "silver"
-        assert DataLayer.GOLD.value == "gold"
-
-    def test_data_layer_is_string_enum(self):
-        """DataLayer should be usable as string via .value."""
-        assert DataLayer.BRONZE.value == "bronze"
-        assert f"prefix_{DataLayer.SILVER.value}" == "prefix_silver"
+    @pytest.mark.parametrize("member,value", [
+        (DataLayer.BRONZE, "bronze"),
+        (DataLayer.SILVER, "silver"),
+        (DataLayer.GOLD, "gold"),
+    ])
+    def test_data_layer_values(self, member, value):
+        """DataLayer members should have correct, string-usable values."""
+        assert member.value == value
+        assert isinstance(member, str)
+        assert member == value
 
 
 class TestTableName:
     """Tests for TableName enum."""
 
-    def test_agent_runs_table_exists(self):
-        """AGENT_RUNS table should be defined."""
-        assert TableName.AGENT_RUNS.value == "agent_runs"
-
-    def test_table_name_is_string_enum(self):
-        """TableName should be usable as string via .value."""
-        assert TableName.AGENT_RUNS.value == "agent_runs"
+    @pytest.mark.parametrize("member,value", [
+        (TableName.AGENT_RUNS, "agent_runs"),
+    ])
+    def test_table_name_values(self, member, value):
+        """Expected tables should be defined with string-usable values."""
+        assert member.value == value
+        assert isinstance(member, str)
+        assert member == value
 
 
 class TestTableNameManager:
@@ -48,30 +60,26 @@ class TestTableNameManager:
         
         assert result == "dev_silver_agent_runs"
 
-    def test_get_table_different_environments(self):
+    @pytest.mark.parametrize("env,expected", [
+        ("local", "local_silver_agent_runs"),
+        ("dev", "dev_silver_agent_runs"),
+        ("stg", "stg_silver_agent_runs"),
+        ("prod", "prod_silver_agent_runs"),
+    ])
+    def test_get_table_different_environments(self, env, expected):
         """Should handle all environment types."""
-        test_cases = [
-            ("local", "local_silver_agent_runs"),
-            ("dev", "dev_silver_agent_runs"),
-            ("stg", "stg_silver_agent_runs"),
-            ("prod", "prod_silver_agent_runs"),
-        ]
-        
-        for env, expected in test_cases:
-            manager = TableNameManager(env=env, layer=DataLayer.SILVER)
-            assert manager.get(TableName.AGENT_RUNS) == expected
-
-    def test_get_table_different_layers(self):
+        manager = TableNameManager(env=env, layer=DataLayer.SILVER)
+        assert manager.get(TableName.AGENT_RUNS) == expected
+
+    @pytest.mark.parametrize("layer,expected", [
+        (DataLayer.BRONZE, "dev_bronze_agent_runs"),
+        (DataLayer.SILVER, "dev_silver_agent_runs"),
+        (DataLayer.GOLD, "dev_gold_agent_runs"),
+    ])
+    def test_get_table_different_layers(self, layer, expected):
         """Should handle all data layers."""
-        test_cases = [
-            (DataLayer.BRONZE, "dev_bronze_agent_runs"),
-            (DataLayer.SILVER, "dev_silver_agent_runs"),
-            (DataLayer.GOLD, "dev_gold_agent_runs"),
-        ]
-        
-        for layer, expected in test_cases:
-            manager = TableNameManager(env="dev", layer=layer)
-            assert manager.get(TableName.AGENT_RUNS) == expected
+        manager = TableNameManager(env="dev", layer=layer)
+        assert manager.get(TableName.AGENT_RUNS) == expected
 
     def test_get_all_tables(self):
         """get_all should return all table names."""
@@ -83,6 +91,23 @@ class TestTableNameManager:
         assert TableName.AGENT_RUNS in all_tables
         assert all_tables[TableName.AGENT_RUNS] == "dev_silver_agent_runs"
 
+    def test_table_names_are_shared_across_managers(self):
+        """Managers for the same env/layer should share one name string."""
+        first = TableNameManager(env="dev", layer=DataLayer.SILVER)
+        second = TableNameManager(env="dev", layer=DataLayer.SILVER)
+
+        assert first.get(TableName.AGENT_RUNS) is second.get(TableName.AGENT_RUNS)
+
+    def test_env_and_layer_are_read_only(self):
+        """env and layer cannot be reassigned out from under the name cache."""
+        manager = TableNameManager(env="dev", layer=DataLayer.SILVER)
+
+        with pytest.raises(AttributeError):
+            manager.env = "prod"
+        with pytest.raises(AttributeError):
+            manager.layer = DataLayer.GOLD
+        assert manager.get(TableName.AGENT_RUNS) == "dev_silver_agent_runs"
+
     def test_manager_repr(self):
         """Manager should have readable repr."""
         manager = TableNameManager(env="prod", layer=DataLayer.GOLD)
@@ -101,11 +126,6 @@ class TestTableNameManager:
     def test_env_from_settings_when_none(self, monkeypatch):
         """Should read environment from settings when not provided."""
         monkeypatch.setenv("APP_ENVIRONMENT", "stg")
-        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
-        
-        # Clear settings cache to pick up new env var
-        from src.config.settings import get_settings
-        get_settings.cache_clear()
         
         manager = TableNameManager(env=None, layer=DataLayer.SILVER)
         
@@ -115,30 +135,36 @@ class TestTableNameManager:
 class TestGetTableManager:
     """Tests for get_table_manager factory function."""
 
-    def test_creates_manager_with_default_layer(self, monkeypatch):
+    def test_creates_manager_with_default_layer(self, _dev_env):
         """Factory should create manager with SILVER as default."""
-        monkeypatch.setenv("APP_ENVIRONMENT", "dev")
-        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
-        
-        from src.config.settings import get_settings
-        get_settings.cache_clear()
-        
         manager = get_table_manager()
         
+        assert manager.env == "dev"
         assert manager.layer == DataLayer.SILVER
 
-    def test_creates_manager_with_specified_layer(self, monkeypatch):
+    def test_creates_manager_with_specified_layer(self, _dev_env):
         """Factory should accept layer parameter."""
-        monkeypatch.setenv("APP_ENVIRONMENT", "dev")
-        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
-        
-        from src.config.settings import get_settings
-        get_settings.cache_clear()
-        
         manager = get_table_manager(layer=DataLayer.GOLD)
         
         assert manager.layer == DataLayer.GOLD
 
+    def test_returns_cached_manager_per_layer(self, _dev_env):
+        """Factory should reuse one manager per (environment, layer)."""
+        assert get_table_manager() is get_table_manager()
+        assert get_table_manager(layer=DataLayer.GOLD) is not get_table_manager()
+
+    def test_cached_manager_follows_settings_reload(self, monkeypatch):
+        """Reloading settings should yield a manager for the new environment."""
+        monkeypatch.setenv("APP_ENVIRONMENT", "dev")
+        dev_manager = get_table_manager()
+
+        monkeypatch.setenv("APP_ENVIRONMENT", "prod")
+        get_settings.cache_clear()  # Reload is the behaviour under test
+        prod_manager = get_table_manager()
+
+        assert dev_manager.env == "dev"
+        assert prod_manager.env == "prod"
+
 
 class TestTableNameTypeSafety:
     """Tests demonstrating type safety benefits."""
@@ -0,0 +1,30 @@
+"""Unit tests for batched database writes."""
+
+from unittest.mock import MagicMock
+
+from src.db.schemas import AgentRunCreate
+from src.db.writes import _INSERT_AGENT_RUN, bulk_insert_runs
+
+
+class TestBulkInsertRuns:
+    """Tests for bulk_insert_runs."""
+
+    def test_executes_prebuilt_statement_once(self):
+        """All rows should go through one execute call."""
+        session = MagicMock()
+        rows = [
+            AgentRunCreate(run_id="run-1", input_text="a").model_dump(),
+            AgentRunCreate(run_id="run-2", input_text="b").model_dump(),
+        ]
+
+        bulk_insert_runs(session, rows)
+
+        session.execute.assert_called_once_with(_INSERT_AGENT_RUN, rows)
+
+    def test_empty_batch_is_noop(self):
+        """An empty batch should not touch the session."""
+        session = MagicMock()
+
+        bulk_insert_runs(session, [])
+
+        session.execute.assert_not_called()